@@ -4,7 +4,7 @@ import os
 import logging
 import requests
 import time
-from typing import Dict, Any
+from typing import Any, Dict, Final
 
 # Internal Core Imports
 from src.core.constants import OrchestrationStatus
@@ -25,6 +25,9 @@ class Dispatcher:
     # Rule 0: Mandatory __slots__ to eliminate dict overhead
     __slots__ = ['token', 'headers']
 
+    # Upper bound on signals in flight at once (see main_engine dispatch phase).
+    MAX_WORKERS: Final = 8
+
     def __init__(self):
         """
         Initializes the Dispatcher with explicit environment validation.
@@ -78,7 +81,8 @@ class Dispatcher:
                 
                 # --- TRACEABILITY LOOP (10s RELIABILITY) ---
                 # We wait 10 seconds to ensure the GitHub API has registered the run.
-                # Total cycle time for a batch of 20 jobs: ~3.5 minutes.
+                # Different target repos wait in parallel (MAX_WORKERS at a time);
+                # steps sharing a repo are dispatched one after another.
                 time.sleep(10.0)
                 
                 runs_url = f"https://api.github.com/repos/{target_repo}/actions/runs?event=repository_dispatch"
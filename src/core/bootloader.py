@@ -4,11 +4,12 @@ import requests
 import logging
 import json
 from pathlib import Path
-from jsonschema import validate
 
 # Internal Core Imports
 from src.core.constants import SystemPaths, OrchestrationStatus
 from src.core.state_engine import OrchestrationState
+from src.core.json_io import loads, read_json, write_json
+from src.core.schema_registry import validate_document
 
 logger = logging.getLogger("Engine.Bootloader")
 
@@ -27,9 +28,7 @@ class Bootloader:
         """
         schema_path = Path(SystemPaths.SCHEMA_DIR) / schema_filename
         try:
-            with open(schema_path, 'r', encoding="utf-8") as s:
-                schema = json.load(s)
-            validate(instance=data, schema=schema)
+            validate_document(data, schema_path)
         except Exception as e:
             logger.critical(f"❌ SCHEMA BREACH: {schema_filename} validation failed.")
             raise RuntimeError(f"CRITICAL: {schema_filename} is corrupt or invalid. {e}")
@@ -43,9 +42,16 @@ class Bootloader:
         config_file = Path(config_path)
         dormant_flag = Path(SystemPaths.CONFIG_DIR) / SystemPaths.DORMANT_FLAG
 
-        if dormant_flag.exists() and config_file.exists():
+        # One stat() per file: a missing flag or config simply skips the wake check.
+        try:
+            config_mtime = config_file.stat().st_mtime
+            flag_mtime = dormant_flag.stat().st_mtime
+        except FileNotFoundError:
+            config_mtime = flag_mtime = None
+
+        if flag_mtime is not None:
             # Rule 1: Efficiency. New config timestamp overrides hibernation.
-            if config_file.stat().st_mtime >= dormant_flag.stat().st_mtime:
+            if config_mtime >= flag_mtime:
                 logger.info("🌅 New Configuration detected. Resetting to STATUS: ACTIVE.")
                 try:
                     dormant_flag.write_text("STATUS: ACTIVE", encoding="utf-8")
@@ -64,14 +70,15 @@ class Bootloader:
         try:
             # 1. Validate Local Entry Point
             active_disk_path = Path(SystemPaths.CONFIG_DIR) / SystemPaths.ACTIVE_DISK
-            active_disk_data = json.loads(active_disk_path.read_text(encoding="utf-8"))
+            active_disk_data = read_json(active_disk_path)
             Bootloader._validate_integrity(active_disk_data, SystemPaths.ACTIVE_DISK_SCHEMA)
 
             # 2. Fetch and Validate Remote Manifest
             logger.info(f"🌐 Fetching Remote Manifest: {state.manifest_url}")
             response = requests.get(state.manifest_url, timeout=15)
             response.raise_for_status()
-            remote_manifest = response.json()
+            # Decode the raw body bytes with the compiled codec (no str round-trip)
+            remote_manifest = loads(response.content)
             Bootloader._validate_integrity(remote_manifest, SystemPaths.MANIFEST_SCHEMA)
 
             # 3. Forensic Integrity Check (Rule 4 Compliance)
@@ -81,17 +88,15 @@ class Bootloader:
 
             ledger_content = {}
             should_reset = False
-            
-            if ledger_path.exists():
-                try:
-                    ledger_content = json.loads(ledger_path.read_text(encoding="utf-8"))
-                    meta = ledger_content["metadata"]
-                    # Pivot Check: If Project or Manifest changed, we must wipe and seed.
-                    if meta["project_id"] != target_pid or meta["manifest_id"] != target_mid:
-                        should_reset = True
-                except (json.JSONDecodeError, KeyError):
+
+            # EAFP: a missing ledger surfaces as FileNotFoundError (no separate exists() stat).
+            try:
+                ledger_content = read_json(ledger_path)
+                meta = ledger_content["metadata"]
+                # Pivot Check: If Project or Manifest changed, we must wipe and seed.
+                if meta["project_id"] != target_pid or meta["manifest_id"] != target_mid:
                     should_reset = True
-            else:
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
                 should_reset = True
 
             # 4. Ledger Seeding Logic (Phase C Pivot Hardening)
@@ -99,14 +104,16 @@ class Bootloader:
                 logger.warning(f"⚠️ Project Shift/Fresh Start: Seeding Ledger for {target_pid}")
                 
                 # Rule 4: No .get() defaults. Missing keys will trigger KeyError here.
-                fresh_steps = {}
-                for step in remote_manifest["pipeline_steps"]:
-                    fresh_steps[step["name"]] = {
-                        "status": OrchestrationStatus.WAITING.value,
+                waiting = OrchestrationStatus.WAITING.value
+                fresh_steps = {
+                    step["name"]: {
+                        "status": waiting,
                         "last_triggered": None,
                         "timeout_hours": step["timeout_hours"],
                         "target_repo": step["target_repo"]
                     }
+                    for step in remote_manifest["pipeline_steps"]
+                }
 
                 ledger_content = {
                     "metadata": {
@@ -118,7 +125,7 @@ class Bootloader:
                 
                 # Rule 1: Clean Room Sync - Atomic Disk Persistence
                 ledger_path.parent.mkdir(parents=True, exist_ok=True)
-                ledger_path.write_text(json.dumps(ledger_content, indent=2), encoding="utf-8")
+                write_json(ledger_path, ledger_content)
                 logger.info("🧹 Ledger seeded and synchronized.")
 
             # Hydrate State Engine attributes
@@ -0,0 +1,83 @@
+# src/core/json_io.py
+
+import contextlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+# Rule 0: Law of Performance.
+# orjson is a compiled codec that parses/serializes straight from/to bytes.
+# The stdlib json module remains the fallback for environments without it.
+# Both paths raise json.JSONDecodeError (orjson's error subclasses it).
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes obj to 2-space indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes obj to 2-space indented UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Reads and decodes a JSON document in a single binary read."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+# path -> ((mtime_ns, size), document)
+_VERSIONED_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def read_json_cached(path: Union[str, Path]) -> Any:
+    """
+    Memoized read_json for reference documents (schemas).
+    Keyed on (path, mtime, size): an edited file is re-parsed, an unchanged one
+    costs a single stat(). The returned object is shared and must not be mutated.
+    """
+    stat = os.stat(path)
+    key = str(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    if key in _VERSIONED_CACHE and _VERSIONED_CACHE[key][0] == version:
+        return _VERSIONED_CACHE[key][1]
+
+    document = read_json(path)
+    _VERSIONED_CACHE[key] = (version, document)
+    return document
+
+
+def write_json(path: Union[str, Path], obj: Any):
+    """
+    Atomic, durable persistence: serialized up-front, written with a single write()
+    to a sibling temp file, fsync'd, renamed over path, then the parent directory is
+    fsync'd so the rename itself survives a crash. Readers never see a truncated
+    document; on failure the temp file is removed and the error re-raised.
+    A hard kill mid-write can leave '<path>.tmp' behind; it is git-ignored under config/ and
+    overwritten by the next write.
+    """
+    payload = dumps(obj)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+    dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
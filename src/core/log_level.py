@@ -0,0 +1,18 @@
+# src/core/log_level.py
+
+import logging
+import os
+
+
+def engine_log_level() -> int:
+    """
+    Resolves ENGINE_LOG_LEVEL once for every entry point's basicConfig().
+    It tunes verbosity (e.g. DEBUG for per-step/per-file traces, WARNING for quiet CI).
+    Accepts a level name or a number; anything else falls back to INFO so a typo
+    cannot crash the engine on import, before Hard-Halt logging is configured.
+    """
+    raw = os.getenv("ENGINE_LOG_LEVEL", "INFO").strip()
+    if raw.isdigit():
+        return int(raw)
+    level = logging.getLevelName(raw.upper())
+    return level if isinstance(level, int) else logging.INFO
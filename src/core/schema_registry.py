@@ -0,0 +1,41 @@
+# src/core/schema_registry.py
+
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+from src.core.json_io import read_json_cached
+
+# Rule 4: Single enforcement point for Schema Sovereignty.
+# Bootloader (active disk, manifest) and OrchestrationState (manifest) both
+# validate through here, so schema loading and caching live in one place.
+
+# Rule 0: jsonschema.validate() re-selects the draft, re-runs check_schema and
+# rebuilds a validator on every call. Those are done once per schema version.
+# path -> (schema document the validator was built from, compiled validator)
+_COMPILED: Dict[str, Tuple[Any, Validator]] = {}
+
+
+def validate_document(instance: Any, schema_path: Union[str, Path]):
+    """
+    Validates instance against the schema stored at schema_path.
+    Raises the underlying I/O, decode or jsonschema error; callers decide how to halt.
+    """
+    schema = read_json_cached(schema_path)
+    key = str(schema_path)
+
+    # read_json_cached returns the identical object until the file changes
+    if key in _COMPILED and _COMPILED[key][0] is schema:
+        validator = _COMPILED[key][1]
+    else:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        _COMPILED[key] = (schema, validator)
+
+    # Same error selection as jsonschema.validate()
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -4,10 +4,11 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from jsonschema import validate
 
 # Internal Core Imports
 from src.core.constants import OrchestrationStatus, SystemPaths
+from src.core.json_io import read_json, write_json
+from src.core.schema_registry import validate_document
 
 logger = logging.getLogger("Engine.State")
 
@@ -32,14 +33,13 @@ class OrchestrationState:
         # Rule 4: Explicit pathing to the Schema Directory
         self.schema_path = Path(SystemPaths.SCHEMA_DIR) / SystemPaths.MANIFEST_SCHEMA
         
-        if not self.data_path.exists():
-            self.data_path.mkdir(parents=True, exist_ok=True)
+        # exist_ok makes this a single mkdir() syscall; no exists() probe needed.
+        self.data_path.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(config_path, 'r', encoding="utf-8") as f:
-                config = json.load(f)
-                self.project_id = config['project_id']
-                self.manifest_url = config['manifest_url']
+            config = read_json(config_path)
+            self.project_id = config['project_id']
+            self.manifest_url = config['manifest_url']
         except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
             raise RuntimeError(f"❌ CRITICAL: Mounting Failed. Configuration Breach: {e}")
         
@@ -53,10 +53,8 @@ class OrchestrationState:
             raise RuntimeError(f"❌ CRITICAL: Hard-Halt - Identity Mismatch: Manifest {manifest_json.get('project_id')} does not match Disk {self.project_id}")
         
         try:
-            with open(self.schema_path, 'r', encoding="utf-8") as s:
-                schema = json.load(s)
-            validate(instance=manifest_json, schema=schema)
-            
+            validate_document(manifest_json, self.schema_path)
+
             self.manifest_data = manifest_json
             logger.info(f"💿 Registry Hydrated & Validated: [{manifest_json['manifest_id']}]")
         except Exception as e:
@@ -107,8 +105,7 @@ class OrchestrationState:
         }
 
         try:
-            with open(self.ledger_path, 'w', encoding="utf-8") as f:
-                json.dump(full_ledger, f, indent=2)
+            write_json(self.ledger_path, full_ledger)
             logger.info(f"💾 Ledger Persisted: {self.ledger_path.name}")
         except Exception as e:
             logger.error(f"❌ Persistence Error: Failed to write ledger. {e}")
@@ -121,6 +118,14 @@ class OrchestrationState:
         if not self.manifest_data:
             raise RuntimeError("❌ CRITICAL: Scan attempted without Manifest Hydration.")
 
+        # Rule 0: Status literals and the data root are resolved once, not per step.
+        data_path = self.data_path
+        waiting = OrchestrationStatus.WAITING.value
+        pending = OrchestrationStatus.PENDING.value
+        in_progress = OrchestrationStatus.IN_PROGRESS.value
+        completed = OrchestrationStatus.COMPLETED.value
+        failed = OrchestrationStatus.FAILED.value
+
         for step in self.manifest_data["pipeline_steps"]:
             name = step["name"]
             entry = orchestration_ledger[name]
@@ -129,8 +134,8 @@ class OrchestrationState:
             # PHYSICAL TRUTH CHECK
             requires = step["requires"]
             produces = step["produces"]
-            inputs_exist = all((self.data_path / f).exists() for f in requires)
-            outputs_exist = all((self.data_path / f).exists() for f in produces)
+            inputs_exist = all((data_path / f).exists() for f in requires)
+            outputs_exist = all((data_path / f).exists() for f in produces)
 
             # --- TRANSITION MATRIX ---
 
@@ -139,26 +144,26 @@ class OrchestrationState:
                 self._update_status(name, entry, OrchestrationStatus.COMPLETED, "Artifact detected.")
 
             # 2. Input Saturation = PENDING
-            elif current_status == OrchestrationStatus.WAITING.value and inputs_exist:
+            elif current_status == waiting and inputs_exist:
                 self._update_status(name, entry, OrchestrationStatus.PENDING, "Inputs detected.")
 
             # 3. Input Loss = Revert to WAITING
-            elif current_status == OrchestrationStatus.PENDING.value and not inputs_exist:
+            elif current_status == pending and not inputs_exist:
                 self._update_status(name, entry, OrchestrationStatus.WAITING, "Input artifacts missing.")
 
             # 4. Temporal Monitoring (IN_PROGRESS)
-            elif current_status == OrchestrationStatus.IN_PROGRESS.value:
+            elif current_status == in_progress:
                 if self._is_job_stale(name, orchestration_ledger):
                     self._update_status(name, entry, OrchestrationStatus.FAILED, "Execution Timeout.")
                 else:
-                    logger.info(f"⏳ {name}: In-flight (within timeout window).")
+                    logger.debug("⏳ %s: In-flight (within timeout window).", name)
 
             # 5. Artifact Drift (COMPLETED but file missing)
-            elif current_status == OrchestrationStatus.COMPLETED.value and not outputs_exist:
+            elif current_status == completed and not outputs_exist:
                 self._update_status(name, entry, OrchestrationStatus.WAITING, "Artifact drift detected.")
 
             # 6. FAILED RECOVERY
-            elif current_status == OrchestrationStatus.FAILED.value:
+            elif current_status == failed:
                 if inputs_exist:
                     self._update_status(name, entry, OrchestrationStatus.PENDING, "Retrying failed step.")
                 else:
@@ -170,11 +175,10 @@ class OrchestrationState:
 
     def get_ready_steps(self, orchestration_ledger: dict):
         """Returns steps currently in PENDING status for the main_engine to trigger."""
-        ready_steps = []
-        for step in self.manifest_data["pipeline_steps"]:
-            name = step["name"]
-            status = orchestration_ledger[name]["status"]
-            if status == OrchestrationStatus.PENDING.value:
-                ready_steps.append(step)
-        
+        pending = OrchestrationStatus.PENDING.value
+        ready_steps = [
+            step for step in self.manifest_data["pipeline_steps"]
+            if orchestration_ledger[step["name"]]["status"] == pending
+        ]
+
         return ready_steps if ready_steps else None
\ No newline at end of file
@@ -8,6 +8,7 @@ from typing import Optional, Dict
 
 # Internal Core Imports
 from src.core.constants import OrchestrationStatus, SystemPaths
+from src.core.json_io import read_json, write_json
 
 # Configure Logger for Engine Traceability
 logger = logging.getLogger("Engine.Ledger")
@@ -44,15 +45,17 @@ class LedgerManager:
         
         new_entry = f"## [{timestamp}] {category}\n- **Message:** {message}{meta_str}\n\n---\n\n"
 
+        # EAFP: open directly instead of stat-then-open; a missing audit is a fresh one.
         existing_content = ""
-        if os.path.exists(self.log_path):
-            try:
-                with open(self.log_path, "r", encoding="utf-8") as f:
-                    current_text = f.read()
-                    # Preserve only the entries, not the duplicated header
-                    existing_content = current_text.replace(self.header, "")
-            except (FileNotFoundError, IOError) as e:
-                logger.warning(f"Audit Read Warning: {e}. Re-initializing buffer.")
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                current_text = f.read()
+                # Preserve only the entries, not the duplicated header
+                existing_content = current_text.replace(self.header, "")
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            logger.warning(f"Audit Read Warning: {e}. Re-initializing buffer.")
 
         try:
             with open(self.log_path, "w", encoding="utf-8") as f:
@@ -68,17 +71,15 @@ class LedgerManager:
         Loads the JSON memory. 
         Enforces a hard structure: {"metadata": {}, "steps": {}}
         """
-        if not os.path.exists(self.orchestration_path):
+        try:
+            content = read_json(self.orchestration_path)
+            # Rule 4 Check: Hard-halt if schema is malformed
+            if "steps" not in content or "metadata" not in content:
+                raise KeyError("Orchestration Ledger schema violation: missing root keys.")
+            return content
+        except FileNotFoundError:
             logger.warning("Orchestration Ledger missing. Initializing fresh structure.")
             return {"metadata": {}, "steps": {}}
-        
-        try:
-            with open(self.orchestration_path, "r", encoding="utf-8") as f:
-                content = json.load(f)
-                # Rule 4 Check: Hard-halt if schema is malformed
-                if "steps" not in content or "metadata" not in content:
-                    raise KeyError("Orchestration Ledger schema violation: missing root keys.")
-                return content
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Orchestration Ledger corrupt ({e}). Resetting to safe structure.")
             return {"metadata": {}, "steps": {}}
@@ -106,8 +107,7 @@ class LedgerManager:
 
         try:
             os.makedirs(os.path.dirname(self.orchestration_path), exist_ok=True)
-            with open(self.orchestration_path, "w", encoding="utf-8") as f:
-                json.dump(ledger, f, indent=2)
+            write_json(self.orchestration_path, ledger)
         except IOError as e:
             logger.critical(f"Failed to write to Orchestration Ledger: {e}")
             raise RuntimeError(f"❌ CRITICAL: Ledger sync failed. {e}")
@@ -122,9 +122,10 @@ class LedgerManager:
         if not ledger_steps:
             new_state = "STATUS: ACTIVE"
         else:
-            # Rule 4: Direct status check
-            statuses = [step["status"] for step in ledger_steps.values()]
-            is_saturated = all(s == OrchestrationStatus.COMPLETED.value for s in statuses)
+            # Rule 4: Direct status check. Short-circuits on the first unfinished
+            # step; the status literal is resolved once, not per comparison.
+            completed = OrchestrationStatus.COMPLETED.value
+            is_saturated = all(step["status"] == completed for step in ledger_steps.values())
             new_state = "STATUS: DORMANT" if is_saturated else "STATUS: ACTIVE"
 
         try:
@@ -32,12 +32,13 @@ import os
 tm = TokenManager(client_id=os.environ['APP_KEY'], client_secret=os.environ['APP_SECRET'])
 ingestor = CloudIngestor(tm, os.environ['REFRESH_TOKEN'], Path(os.environ['LOG_FILE']))
 
-# Execution: Passing an empty list [] to allowed_ext bypasses the filter.
-# This ensures all artifacts (including .zip) are synchronized.
-ingestor.sync(
+# Execution: The full folder (including .zip artifacts) is pulled as a single
+# server-side archive instead of one HTTPS round trip per file. Folders over
+# Dropbox's archive limit, or too large to spool and extract on the runner's
+# disk, fall back to the per-file sync().
+ingestor.sync_archive(
     os.environ['DROPBOX_FOLDER'], 
-    Path(os.environ['LOCAL_FOLDER']), 
-    []
+    Path(os.environ['LOCAL_FOLDER'])
 )
 "
 
@@ -10,15 +10,21 @@ Compliance:
 """
 
 import os
+import shutil
 import logging
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Union
+from typing import Final, List, Union
 import dropbox
 from src.io.dropbox_utils import TokenManager
+from src.core.log_level import engine_log_level
 
 # Configure Logger for Ingestion Traceability
 logging.basicConfig(
-    level=logging.INFO,
+    level=engine_log_level(),
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
 )
 logger = logging.getLogger("Engine.CloudIngestor")
@@ -30,6 +36,12 @@ class CloudIngestor:
     """
     __slots__ = ['dbx', 'log_path', 'token_manager']
 
+    # Rule 0: Transfers are latency-bound HTTPS round trips; overlap them.
+    # Matches the connection pool size of the Dropbox SDK session.
+    MAX_WORKERS: Final = 8
+    # Streaming block size: peak memory stays constant regardless of artifact size.
+    CHUNK_SIZE: Final = 1 << 20
+
     def __init__(self, token_manager: TokenManager, refresh_token: str, log_path: Union[str, Path]):
         """
         Deterministic initialization via TokenManager dependency.
@@ -59,50 +71,172 @@ class CloudIngestor:
         
         target_folder.mkdir(parents=True, exist_ok=True)
         
+        # Rule 0: O(1) membership per entry instead of a list scan
+        allowed = frozenset(allowed_ext)
+
         # Normalize source folder for relative path math
         src_base = source_folder.lower().rstrip('/')
         if not src_base.startswith('/'):
             src_base = f"/{src_base}"
         
+        # Directories already materialized this run: one mkdir per directory,
+        # not one per file (Dropbox lists many files under the same parent).
+        created = {target_folder}
+
         try:
             cursor = None
             has_more = True
-            
-            while has_more:
-                if cursor:
-                    result = self.dbx.files_list_folder_continue(cursor)
-                else:
-                    result = self.dbx.files_list_folder(source_folder, recursive=True)
-                
-                for entry in result.entries:
-                    # Logic Gate: Identify Files for Ingestion
-                    if isinstance(entry, dropbox.files.FileMetadata):
-                        ext = Path(entry.name).suffix.lower()
-                        
-                        # Rule 4 & 5: If allowed_ext is empty [], all files are ingested.
-                        if not allowed_ext or ext in allowed_ext:
-                            # Calculate relative path from the source root for folder reconstruction
-                            rel_path = os.path.relpath(entry.path_lower, src_base)
-                            local_file_path = target_folder / rel_path
-                            
-                            # Ensure local directory structure matches cloud structure
-                            local_file_path.parent.mkdir(parents=True, exist_ok=True)
-                            self._download_file(entry.path_lower, local_file_path)
-                    
-                    # Logic Gate: Explicit Folder Reconstruction
-                    elif isinstance(entry, dropbox.files.FolderMetadata):
-                        rel_path = os.path.relpath(entry.path_lower, src_base)
-                        (target_folder / rel_path).mkdir(parents=True, exist_ok=True)
-
-                has_more = result.has_more
-                cursor = result.cursor
-                
+
+            # Hard-Halt signal: set by the first transfer to fail, checked per page.
+            failed = threading.Event()
+            failures: List[Future] = []
+
+            def on_transfer_done(transfer: Future):
+                if not transfer.cancelled() and transfer.exception() is not None:
+                    failures.append(transfer)
+                    failed.set()
+
+            # Pipelined ingestion: transfers start as soon as their page is listed,
+            # so page fetches (files_list_folder_continue) overlap with downloads.
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+                transfers: List[Future] = []
+                try:
+                    while has_more and not failed.is_set():
+                        if cursor:
+                            result = self.dbx.files_list_folder_continue(cursor)
+                        else:
+                            result = self.dbx.files_list_folder(source_folder, recursive=True)
+
+                        for entry in result.entries:
+                            # Logic Gate: Identify Files for Ingestion
+                            if isinstance(entry, dropbox.files.FileMetadata):
+                                ext = Path(entry.name).suffix.lower()
+
+                                # Rule 4 & 5: If allowed_ext is empty [], all files are ingested.
+                                if not allowed or ext in allowed:
+                                    # Calculate relative path from the source root for folder reconstruction
+                                    rel_path = os.path.relpath(entry.path_lower, src_base)
+                                    local_file_path = target_folder / rel_path
+
+                                    # Ensure local directory structure matches cloud structure
+                                    if local_file_path.parent not in created:
+                                        local_file_path.parent.mkdir(parents=True, exist_ok=True)
+                                        created.add(local_file_path.parent)
+                                    transfer = pool.submit(self._download_file, entry.path_lower, local_file_path)
+                                    transfer.add_done_callback(on_transfer_done)
+                                    transfers.append(transfer)
+
+                            # Logic Gate: Explicit Folder Reconstruction
+                            elif isinstance(entry, dropbox.files.FolderMetadata):
+                                rel_path = os.path.relpath(entry.path_lower, src_base)
+                                local_dir = target_folder / rel_path
+                                if local_dir not in created:
+                                    local_dir.mkdir(parents=True, exist_ok=True)
+                                    created.add(local_dir)
+
+                        has_more = result.has_more
+                        cursor = result.cursor
+
+                    # The first failed download re-raises here (Hard-Halt preserved).
+                    if failures:
+                        failures[0].result()
+                    for transfer in transfers:
+                        transfer.result()
+                except BaseException:
+                    # Hard-Halt: drop queued transfers instead of draining them.
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+
             logger.info(f"🎉 Ingestion complete for {source_folder}")
 
         except dropbox.exceptions.ApiError as e:
             logger.error(f"❌ Dropbox API Error during sync: {e}")
             raise
 
+    def sync_archive(self, source_folder: str, target_folder: Union[str, Path]):
+        """
+        Archive ingestion: the folder is fetched as one server-side ZIP.
+        Replaces one download round trip per file with a single call; the only
+        other requests are the paginated listing used to size the folder.
+        Dropbox caps archives at 20 GB / 10,000 entries; folders over either limit
+        fall back to sync(). Local names are lowercased exactly as sync() does.
+        The archive is spooled to a temp file in the target folder (deleted on
+        exit) while extracting, so peak disk use on that filesystem is twice the
+        folder size; folders that would not fit are streamed per file by sync().
+        """
+        logger.info(f"🚀 Archive ingestion started: {source_folder}")
+
+        if isinstance(target_folder, str):
+            target_folder = Path(target_folder)
+
+        target_folder.mkdir(parents=True, exist_ok=True)
+        target_root = target_folder.resolve()
+
+        try:
+            # Disk Guard: spool + extracted copy must both fit beside each other.
+            required = 2 * self._folder_size(source_folder)
+            if required > shutil.disk_usage(target_folder).free:
+                logger.warning(f"⚠️ {source_folder} needs {required} bytes to extract locally. Falling back to per-file sync.")
+                self.sync(source_folder, target_folder, [])
+                return
+
+            try:
+                metadata, res = self.dbx.files_download_zip(source_folder)
+            except dropbox.exceptions.ApiError as e:
+                if isinstance(e.error, dropbox.files.DownloadZipError) and (
+                        e.error.is_too_large() or e.error.is_too_many_files()):
+                    logger.warning(f"⚠️ {source_folder} exceeds the archive limit. Falling back to per-file sync.")
+                    self.sync(source_folder, target_folder, [])
+                    return
+                raise
+
+            # Spool to an anonymous temp file: ZipFile needs a seekable stream.
+            # It lives in the target folder, on the disk the Disk Guard measured.
+            with tempfile.TemporaryFile(dir=target_folder) as spool:
+                with res:
+                    for chunk in res.iter_content(chunk_size=self.CHUNK_SIZE):
+                        spool.write(chunk)
+
+                with zipfile.ZipFile(spool) as archive:
+                    for member in archive.infolist():
+                        # Entries are rooted at the source folder name; strip it.
+                        # Lowercased to match sync(), which names files from path_lower:
+                        # manifest artifact matching must not depend on the ingestion path.
+                        rel_parts = Path(member.filename.lower()).parts[1:]
+                        if not rel_parts:
+                            continue
+
+                        local_path = target_folder.joinpath(*rel_parts)
+                        # Clean Room: refuse entries that escape the target folder.
+                        if target_root not in local_path.resolve().parents:
+                            raise RuntimeError(f"❌ CRITICAL: Archive entry escapes target: {member.filename}")
+
+                        if member.is_dir():
+                            local_path.mkdir(parents=True, exist_ok=True)
+                            continue
+
+                        local_path.parent.mkdir(parents=True, exist_ok=True)
+                        with archive.open(member) as src, open(local_path, "wb") as dst:
+                            shutil.copyfileobj(src, dst, self.CHUNK_SIZE)
+
+            logger.info(f"🎉 Archive ingestion complete for {source_folder}")
+
+        except dropbox.exceptions.ApiError as e:
+            logger.error(f"❌ Dropbox API Error during archive sync: {e}")
+            raise
+
+    def _folder_size(self, source_folder: str) -> int:
+        """
+        Total bytes of every file under source_folder (recursive listing only).
+        """
+        total = 0
+        result = self.dbx.files_list_folder(source_folder, recursive=True)
+        while True:
+            total += sum(e.size for e in result.entries if isinstance(e, dropbox.files.FileMetadata))
+            if not result.has_more:
+                return total
+            result = self.dbx.files_list_folder_continue(result.cursor)
+
     def _download_file(self, dropbox_path: str, local_path: Path):
         """
         Internal helper for specific file transfer.
@@ -111,9 +245,12 @@ class CloudIngestor:
         try:
             metadata, res = self.dbx.files_download(path=dropbox_path)
             # Binary write ensures simulation artifacts (.npy, .h5, .zip) remain uncorrupted.
-            with open(local_path, "wb") as f:
-                f.write(res.content)
-            logger.info(f"📁 Synced: {dropbox_path} -> {local_path}")
+            # The body is streamed straight to disk instead of buffered via res.content.
+            with res, open(local_path, "wb") as f:
+                for chunk in res.iter_content(chunk_size=self.CHUNK_SIZE):
+                    f.write(chunk)
+            # Per-file line: lazily formatted, emitted only at ENGINE_LOG_LEVEL=DEBUG.
+            logger.debug("📁 Synced: %s -> %s", dropbox_path, local_path)
         except Exception as e:
             logger.error(f"❌ Failed to download {dropbox_path}: {e}")
             raise
\ No newline at end of file
@@ -10,47 +10,86 @@ Compliance:
 """
 
 import logging
-from typing import Final
+import time
+from typing import Dict, Final, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Standard logger setup
 logger = logging.getLogger(__name__)
 
+# Rule 0: One pooled keep-alive session for every token exchange.
+# Avoids a fresh TCP+TLS handshake per refresh; transient failures are retried.
+# A refresh-token exchange is idempotent, so the POST is retried on connect/read
+# errors and on 429/5xx. raise_on_status=False hands the last response back to
+# refresh_access_token, which reports it as an auth failure.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        allowed_methods=frozenset({"POST"}),
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False
+    )
+))
+
 class TokenManager:
     """
     Manages OAuth2 token lifecycle with strict memory management.
     """
-    __slots__ = ['_client_id', '_client_secret']
-    
+    __slots__ = ['_client_id', '_client_secret', '_token_cache']
+
     TOKEN_URL: Final = "https://api.dropbox.com/oauth2/token"
+    REQUEST_TIMEOUT: Final = 10
+    # Cached tokens are refreshed this many seconds before Dropbox expires them.
+    EXPIRY_MARGIN: Final = 60
 
     def __init__(self, client_id: str, client_secret: str):
         # Rule 5: Deterministic Initialization
         self._client_id = client_id
         self._client_secret = client_secret
+        # refresh_token -> (access_token, monotonic expiry deadline)
+        self._token_cache: Dict[str, Tuple[str, float]] = {}
         logger.debug("TokenManager initialized with explicit configuration.")
 
     def refresh_access_token(self, refresh_token: str) -> str:
         """
         Refreshes the OAuth2 access token.
+        A still-valid token for the same refresh_token is served from cache.
         """
+        if refresh_token in self._token_cache:
+            access_token, expires_at = self._token_cache[refresh_token]
+            if time.monotonic() < expires_at:
+                logger.debug("Reusing cached Dropbox access token.")
+                return access_token
+
         logger.info("Attempting to refresh Dropbox access token...")
-        
+
         payload = {
             "grant_type": "refresh_token",
             "refresh_token": refresh_token,
             "client_id": self._client_id,
             "client_secret": self._client_secret
         }
-        
+
         try:
-            response = requests.post(self.TOKEN_URL, data=payload)
-            
+            response = _SESSION.post(self.TOKEN_URL, data=payload, timeout=self.REQUEST_TIMEOUT)
+
             if response.status_code == 200:
                 logger.info("✅ Dropbox access token successfully refreshed.")
-                return response.json()["access_token"]
-            
+                body = response.json()
+                access_token = body["access_token"]
+                # Only cache when Dropbox states a lifetime; never assume one.
+                if "expires_in" in body:
+                    expires_at = time.monotonic() + body["expires_in"] - self.EXPIRY_MARGIN
+                    self._token_cache[refresh_token] = (access_token, expires_at)
+                return access_token
+
             # Log the failure before raising
             error_msg = f"❌ Dropbox Auth Failed | Status: {response.status_code} | Body: {response.text}"
             logger.error(error_msg)
@@ -58,4 +97,4 @@ class TokenManager:
 
         except requests.exceptions.RequestException as e:
             logger.critical(f"Network error during Dropbox authentication: {str(e)}")
-            raise
\ No newline at end of file
+            raise
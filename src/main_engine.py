@@ -2,6 +2,8 @@
 
 import sys
 import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # Internal Core Imports
@@ -9,10 +11,11 @@ from src.core.constants import OrchestrationStatus, SystemPaths
 from src.core.bootloader import Bootloader
 from src.api.github_trigger import Dispatcher
 from src.core.update_ledger import LedgerManager
+from src.core.log_level import engine_log_level
 
 # Rule 5: Standardized Logging Format for Audit Trail
 logging.basicConfig(
-    level=logging.INFO, 
+    level=engine_log_level(),
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
 )
 logger = logging.getLogger("Engine.Main")
@@ -78,12 +81,15 @@ def run_engine():
     # 6. Dispatch (The TRIGGER phase)
     logger.info(f"🚀 Pulse Detected: {len(target_steps)} tasks ready for activation.")
     dispatcher = Dispatcher()
-    
+
+    # Rule 4: Every payload is built (and every mandatory key checked) before
+    # the first signal fires, so a malformed manifest halts with nothing dispatched.
+    dispatches = []
     for step in target_steps:
         try:
             # Rule 4: Strict key access.
             manifest_id = state.manifest_data["manifest_id"]
-            
+
             payload = {
                 "project_id": state.project_id,
                 "manifest_id": manifest_id,
@@ -91,25 +97,61 @@ def run_engine():
                 "requires": step['requires'],
                 "produces": step['produces']
             }
-            
-            # Logic Gate: Signal the Remote Worker
-            if dispatcher.trigger_worker(step['target_repo'], payload):
-                # log_dispatch updates JSON memory status to IN_PROGRESS
-                # and performs a final sync of the orchestration_ledger.json.
-                ledger_manager.log_dispatch(
-                    project_id=state.project_id, 
-                    manifest_id=manifest_id, 
-                    step_name=step['name'], 
-                    target_repo=step['target_repo'],
-                    timeout_hours=step['timeout_hours']
-                )
-            else:
-                logger.error(f"❌ DISPATCH FAILED: {step['target_repo']} - Manual check required.")
+            dispatches.append((step['target_repo'], step['timeout_hours'], payload))
 
         except KeyError as e:
             logger.critical(f"Protocol Breach: Missing mandatory manifest key {e}")
             sys.exit(1)
 
+    # Rule 0: Signals to different repos are independent, so their ~10s
+    # traceability waits overlap, up to MAX_WORKERS repos at a time.
+    # Steps sharing a target_repo stay sequential: each runs lookup must see its
+    # own dispatch as workflow_runs[0], not a sibling fired at the same moment.
+    by_repo = {}
+    for index, (target_repo, _, _) in enumerate(dispatches):
+        by_repo.setdefault(target_repo, deque()).append(index)
+
+    def signal(index):
+        target_repo, _, payload = dispatches[index]
+        try:
+            return dispatcher.trigger_worker(target_repo, payload)
+        except Exception as e:
+            # One broken signal must not cost the ledger entries of the others.
+            logger.error(f"❌ Dispatch Error [{target_repo}]: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=min(len(by_repo), Dispatcher.MAX_WORKERS)) as pool:
+        in_flight = {}
+        for queue in by_repo.values():
+            index = queue.popleft()
+            in_flight[pool.submit(signal, index)] = (index, queue)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, queue = in_flight.pop(future)
+                # The repo's next step fires only once this one has been traced.
+                if queue:
+                    next_index = queue.popleft()
+                    in_flight[pool.submit(signal, next_index)] = (next_index, queue)
+
+                target_repo, timeout_hours, payload = dispatches[index]
+                # Logic Gate: Signal the Remote Worker
+                if future.result():
+                    # log_dispatch updates JSON memory status to IN_PROGRESS
+                    # and performs a final sync of the orchestration_ledger.json.
+                    # Ledger writes stay on this thread and land as each signal
+                    # is accepted, so a killed runner loses at most the in-flight ones.
+                    ledger_manager.log_dispatch(
+                        project_id=state.project_id,
+                        manifest_id=payload["manifest_id"],
+                        step_name=payload["step"],
+                        target_repo=target_repo,
+                        timeout_hours=timeout_hours
+                    )
+                else:
+                    logger.error(f"❌ DISPATCH FAILED: {target_repo} - Manual check required.")
+
     logger.info("🏁 Cycle Complete: All identified ready-tasks dispatched.")
 
 if __name__ == "__main__": # pragma: no cover
@@ -0,0 +1,62 @@
+# tests/core/test_json_io.py
+
+import json
+import pytest
+from unittest.mock import patch
+from src.core.json_io import read_json, read_json_cached, write_json
+
+class TestJsonCodec:
+
+    def test_round_trip_preserves_ledger_structure(self, tmp_path):
+        """Rule 4: A persisted ledger must decode to the exact same structure."""
+        ledger_path = tmp_path / "ledger.json"
+        ledger = {
+            "metadata": {"project_id": "P1", "manifest_id": "M1"},
+            "steps": {"alpha": {"status": "WAITING", "last_triggered": None, "timeout_hours": 6}}
+        }
+
+        write_json(ledger_path, ledger)
+
+        assert read_json(ledger_path) == ledger
+        # Stdlib-compatible output: 2-space indentation, readable by json.loads
+        assert json.loads(ledger_path.read_text(encoding="utf-8")) == ledger
+        assert '\n  "metadata"' in ledger_path.read_text(encoding="utf-8")
+
+    def test_corrupt_payload_raises_stdlib_decode_error(self, tmp_path):
+        """Callers catch json.JSONDecodeError regardless of the active codec."""
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{ incomplete_json: ", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            read_json(corrupt)
+
+    def test_cached_read_tracks_file_version(self, tmp_path):
+        """Rule 0: Unchanged schemas are parsed once; edited schemas are re-read."""
+        schema_path = tmp_path / "schema.json"
+        write_json(schema_path, {"type": "object"})
+
+        first = read_json_cached(schema_path)
+        assert read_json_cached(schema_path) is first
+
+        write_json(schema_path, {"type": "object", "required": ["project_id"]})
+        assert read_json_cached(schema_path) == {"type": "object", "required": ["project_id"]}
+
+    def test_write_is_atomic_and_cleans_up_on_failure(self, tmp_path):
+        """Rule 4: A failed write leaves the previous document and no temp file behind."""
+        ledger_path = tmp_path / "ledger.json"
+        write_json(ledger_path, {"steps": {}})
+        assert not (tmp_path / "ledger.json.tmp").exists()
+
+        # Durability: the parent directory is fsync'd after the rename
+        with patch("src.core.json_io.os.fsync") as mock_fsync:
+            write_json(ledger_path, {"steps": {}})
+        assert mock_fsync.call_count == 2
+
+        # Target is a directory: the final rename must fail
+        blocked = tmp_path / "blocked"
+        blocked.mkdir()
+        with pytest.raises(OSError):
+            write_json(blocked, {"steps": {}})
+
+        assert not (tmp_path / "blocked.tmp").exists()
+        assert read_json(ledger_path) == {"steps": {}}
@@ -0,0 +1,23 @@
+# tests/core/test_log_level.py
+
+import logging
+import pytest
+from src.core.log_level import engine_log_level
+
+class TestEngineLogLevel:
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("debug", logging.DEBUG),
+        (" WARNING ", logging.WARNING),
+        ("10", logging.DEBUG),
+        ("verbose", logging.INFO),
+        ("-5", logging.INFO),
+    ])
+    def test_resolves_names_and_numbers(self, monkeypatch, raw, expected):
+        """Rule 4: Level names and numbers resolve; unknown values fall back to INFO."""
+        monkeypatch.setenv("ENGINE_LOG_LEVEL", raw)
+        assert engine_log_level() == expected
+
+    def test_defaults_to_info_when_unset(self, monkeypatch):
+        monkeypatch.delenv("ENGINE_LOG_LEVEL", raising=False)
+        assert engine_log_level() == logging.INFO
@@ -0,0 +1,46 @@
+# tests/core/test_schema_registry.py
+
+import json
+import pytest
+from unittest.mock import patch
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import validator_for
+from src.core.schema_registry import validate_document
+
+class TestSchemaRegistry:
+
+    def test_conforming_document_passes(self, tmp_path):
+        """Rule 4: A document satisfying its schema validates silently."""
+        schema_path = tmp_path / "manifest_schema.json"
+        schema_path.write_text(json.dumps({"type": "object", "required": ["manifest_id"]}))
+
+        validate_document({"manifest_id": "M1"}, schema_path)
+
+    def test_breach_raises_validation_error(self, tmp_path):
+        """Rule 4: Missing mandatory keys surface the raw jsonschema error to the caller."""
+        schema_path = tmp_path / "manifest_schema.json"
+        schema_path.write_text(json.dumps({"type": "object", "required": ["manifest_id"]}))
+
+        with pytest.raises(ValidationError, match="manifest_id"):
+            validate_document({"project_id": "P1"}, schema_path)
+
+    def test_missing_schema_raises(self, tmp_path):
+        """Schema Sovereignty: No schema on disk means no validation pass."""
+        with pytest.raises(FileNotFoundError):
+            validate_document({}, tmp_path / "absent_schema.json")
+
+    def test_validator_compiled_once_per_schema_version(self, tmp_path):
+        """Rule 0: check_schema runs once per schema version, not once per document."""
+        schema_path = tmp_path / "active_disk_schema.json"
+        schema_path.write_text(json.dumps({"type": "object", "required": ["project_id"]}))
+
+        with patch("src.core.schema_registry.validator_for", wraps=validator_for) as mock_for:
+            validate_document({"project_id": "P1"}, schema_path)
+            validate_document({"project_id": "P2"}, schema_path)
+            assert mock_for.call_count == 1
+
+            # An edited schema is recompiled and enforced
+            schema_path.write_text(json.dumps({"type": "object", "required": ["manifest_url"]}))
+            with pytest.raises(ValidationError, match="manifest_url"):
+                validate_document({"project_id": "P1"}, schema_path)
+            assert mock_for.call_count == 2
@@ -23,7 +23,7 @@ class TestLedgerForensics:
 
     def test_record_event_read_failure_recovery(self, manager):
         """Covers Lines 53-55: Ensures 'existing_content' resets to empty on read error."""
-        # 1. Setup: Physical file for the 'os.path.exists' check (Line 48)
+        # 1. Setup: Physical file so the read path is taken
         with open(manager.log_path, "w", encoding="utf-8") as f:
             f.write("Initial Content")
         
@@ -51,15 +51,13 @@ class TestLedgerForensics:
     def test_record_event_critical_write_failure(self, manager):
         """Covers Lines 60-62: Specifically targets the WRITE IOError."""
         m = mock_open()
-        # We must allow the os.path.exists check to pass to reach Line 50
-        with patch("os.path.exists", return_value=True):
-            # 1st call (Line 50: read) succeeds
-            # 2nd call (Line 58: write) fails
-            m.side_effect = [m.return_value, IOError("Disk Full")]
-            
-            with patch("builtins.open", m):
-                with pytest.raises(RuntimeError, match="Could not update performance audit"):
-                    manager.record_event("FAIL", "Critical write test")
+        # 1st call (Line 50: read) succeeds
+        # 2nd call (Line 58: write) fails
+        m.side_effect = [m.return_value, IOError("Disk Full")]
+
+        with patch("builtins.open", m):
+            with pytest.raises(RuntimeError, match="Could not update performance audit"):
+                manager.record_event("FAIL", "Critical write test")
 
     # --- SECTION 2: ORCHESTRATION MEMORY (JSON) COVERAGE ---
 
@@ -1,9 +1,14 @@
 # tests/io/download_from_dropbox/test_negative.py
 
+import io
+import tempfile
+import threading
+import zipfile
 import pytest
 import dropbox
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from src.io.download_from_dropbox import CloudIngestor
 
 class TestCloudIngestor:
@@ -68,6 +73,114 @@ class TestCloudIngestor:
             # Verify file download trigger (Line 90)
             mock_down.assert_called_once()
 
+    def test_sync_concurrent_downloads(self, ingestor, tmp_path):
+        """Rule 0: Every matched file is transferred through the worker pool."""
+        mock_result = MagicMock(has_more=False, cursor="v1")
+        entries = []
+        for i in range(5):
+            entry = MagicMock(spec=dropbox.files.FileMetadata)
+            entry.name = f"frame_{i}.npy"
+            entry.path_lower = f"/data/frame_{i}.npy"
+            entries.append(entry)
+        mock_result.entries = entries
+        ingestor.dbx.files_list_folder.return_value = mock_result
+
+        with patch.object(CloudIngestor, "_download_file") as mock_down:
+            ingestor.sync("/data", tmp_path, [".npy"])
+
+        downloaded = sorted(call.args[0] for call in mock_down.call_args_list)
+        assert downloaded == [f"/data/frame_{i}.npy" for i in range(5)]
+
+    def test_sync_creates_each_directory_once(self, ingestor, tmp_path):
+        """Rule 0: Sibling files share one mkdir for their parent directory."""
+        mock_result = MagicMock(has_more=False, cursor="v1")
+        entries = []
+        for i in range(3):
+            entry = MagicMock(spec=dropbox.files.FileMetadata)
+            entry.name = f"frame_{i}.npy"
+            entry.path_lower = f"/data/run/frame_{i}.npy"
+            entries.append(entry)
+        mock_result.entries = entries
+        ingestor.dbx.files_list_folder.return_value = mock_result
+
+        with patch.object(CloudIngestor, "_download_file"), \
+             patch.object(Path, "mkdir", autospec=True) as mock_mkdir:
+            ingestor.sync("/data", tmp_path, [".npy"])
+
+        made = [call.args[0] for call in mock_mkdir.call_args_list]
+        assert made == [tmp_path, tmp_path / "run"]
+
+    def test_sync_pipelines_pages_with_downloads(self, ingestor, tmp_path):
+        """Rule 0: Page-1 transfers are in flight before page 2 is requested."""
+        def file_entry(name):
+            entry = MagicMock(spec=dropbox.files.FileMetadata)
+            entry.name = name
+            entry.path_lower = f"/data/{name}"
+            return entry
+
+        page1 = MagicMock(has_more=True, cursor="c1", entries=[file_entry("a.npy")])
+        page2 = MagicMock(has_more=False, cursor="c2", entries=[file_entry("b.npy")])
+        first_transfer_started = threading.Event()
+        overlap = []
+
+        def list_continue(cursor):
+            overlap.append(first_transfer_started.wait(timeout=5))
+            return page2
+
+        ingestor.dbx.files_list_folder.return_value = page1
+        ingestor.dbx.files_list_folder_continue.side_effect = list_continue
+
+        with patch.object(CloudIngestor, "_download_file", side_effect=lambda *_: first_transfer_started.set()) as mock_down:
+            ingestor.sync("/data", tmp_path, [])
+
+        assert overlap == [True]
+        assert mock_down.call_count == 2
+
+    def test_sync_download_failure_halts(self, ingestor, tmp_path):
+        """Rule 4: A failed transfer inside the pool must surface to the caller."""
+        mock_result = MagicMock(has_more=False, cursor="v1")
+        entry = MagicMock(spec=dropbox.files.FileMetadata)
+        entry.name = "broken.npy"
+        entry.path_lower = "/data/broken.npy"
+        mock_result.entries = [entry]
+        ingestor.dbx.files_list_folder.return_value = mock_result
+
+        with patch.object(CloudIngestor, "_download_file", side_effect=Exception("Network Timeout")):
+            with pytest.raises(Exception, match="Network Timeout"):
+                ingestor.sync("/data", tmp_path, [".npy"])
+
+    def test_sync_failure_stops_pagination(self, ingestor, tmp_path):
+        """Rule 4: Hard-Halt - a failed page-1 transfer stops listing further pages."""
+        entry = MagicMock(spec=dropbox.files.FileMetadata)
+        entry.name = "broken.npy"
+        entry.path_lower = "/data/broken.npy"
+        page1 = MagicMock(cursor="c1", entries=[entry])
+        transfer_settled = threading.Event()
+        real_submit = ThreadPoolExecutor.submit
+
+        def submit_and_watch(pool, fn, *args):
+            # Done-callbacks run only after the future has stored its exception
+            future = real_submit(pool, fn, *args)
+            future.add_done_callback(lambda _: transfer_settled.set())
+            return future
+
+        def has_more_after_failure():
+            # Page 1 is exhausted only once its transfer has failed
+            assert transfer_settled.wait(timeout=5)
+            return True
+
+        type(page1).has_more = PropertyMock(side_effect=has_more_after_failure)
+        ingestor.dbx.files_list_folder.return_value = page1
+        # Terminal page: a regression fails the assertion below instead of hanging
+        ingestor.dbx.files_list_folder_continue.return_value = MagicMock(entries=[], has_more=False)
+
+        with patch.object(ThreadPoolExecutor, "submit", submit_and_watch), \
+                patch.object(CloudIngestor, "_download_file", side_effect=Exception("Network Timeout")):
+            with pytest.raises(Exception, match="Network Timeout"):
+                ingestor.sync("/data", tmp_path, [])
+
+        ingestor.dbx.files_list_folder_continue.assert_not_called()
+
     def test_sync_api_error_handling(self, ingestor, tmp_path):
         """Covers Lines 102-104."""
         # Use positional arguments to avoid SDK signature TypeErrors
@@ -77,13 +190,120 @@ class TestCloudIngestor:
         with pytest.raises(dropbox.exceptions.ApiError):
             ingestor.sync("/src", tmp_path, [])
 
+    # --- SECTION 2b: ARCHIVE SYNC LOGIC ---
+
+    @staticmethod
+    def _zip_response(members):
+        """Builds a mock streamed response carrying a ZIP of {name: bytes}."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for name, payload in members.items():
+                archive.writestr(name, payload)
+        res = MagicMock()
+        res.iter_content.return_value = [buffer.getvalue()]
+        return res
+
+    @staticmethod
+    def _list_sizes(ingestor, *sizes):
+        """Mocks a single-page recursive listing of files with the given byte sizes."""
+        entries = []
+        for size in sizes:
+            entry = MagicMock(spec=dropbox.files.FileMetadata)
+            entry.size = size
+            entries.append(entry)
+        ingestor.dbx.files_list_folder.return_value = MagicMock(entries=entries, has_more=False)
+
+    def test_sync_archive_reconstructs_tree(self, ingestor, tmp_path):
+        """Rule 1: Archive entries land under the target, stripped of the root folder."""
+        self._list_sizes(ingestor, 4, 2)
+        res = self._zip_response({
+            "pipeline/": b"",
+            "pipeline/simulation.npy": b"\x00\xFF\xAA\x55",
+            "pipeline/logs/": b"",
+            "pipeline/logs/run.txt": b"ok",
+        })
+        ingestor.dbx.files_download_zip.return_value = (None, res)
+
+        with patch("tempfile.TemporaryFile", wraps=tempfile.TemporaryFile) as mock_spool:
+            ingestor.sync_archive("/pipeline", str(tmp_path))
+
+        # The spool shares the filesystem the Disk Guard measured
+        mock_spool.assert_called_once_with(dir=tmp_path)
+        ingestor.dbx.files_download_zip.assert_called_once_with("/pipeline")
+        assert (tmp_path / "simulation.npy").read_bytes() == b"\x00\xFF\xAA\x55"
+        assert (tmp_path / "logs" / "run.txt").read_bytes() == b"ok"
+
+    def test_sync_archive_lowercases_names_like_sync(self, ingestor, tmp_path):
+        """Rule 4: Local names match sync() (path_lower) regardless of display case."""
+        self._list_sizes(ingestor, 4, 2)
+        res = self._zip_response({"Pipeline/Mesh.npy": b"mesh", "Pipeline/Logs/Run.TXT": b"ok"})
+        ingestor.dbx.files_download_zip.return_value = (None, res)
+
+        ingestor.sync_archive("/pipeline", tmp_path)
+
+        assert sorted(p.name for p in tmp_path.rglob("*")) == ["logs", "mesh.npy", "run.txt"]
+
+    @pytest.mark.parametrize("limit", ["too_large", "too_many_files"])
+    def test_sync_archive_falls_back_over_limit(self, ingestor, tmp_path, limit):
+        """Folders over the archive limit are ingested per file instead of failing."""
+        self._list_sizes(ingestor, 4, 2)
+        ingestor.dbx.files_download_zip.side_effect = dropbox.exceptions.ApiError(
+            "1", getattr(dropbox.files.DownloadZipError, limit), "Archive Limit", None
+        )
+        with patch.object(CloudIngestor, "sync") as mock_sync:
+            ingestor.sync_archive("/pipeline", tmp_path)
+
+        mock_sync.assert_called_once_with("/pipeline", tmp_path, [])
+
+    def test_sync_archive_falls_back_without_disk_space(self, ingestor, tmp_path):
+        """Folders whose spool + extraction exceed free disk are streamed per file."""
+        self._list_sizes(ingestor, 600, 400)
+        with patch("shutil.disk_usage", return_value=MagicMock(free=1999)), \
+                patch.object(CloudIngestor, "sync") as mock_sync:
+            ingestor.sync_archive("/pipeline", tmp_path)
+
+        ingestor.dbx.files_download_zip.assert_not_called()
+        mock_sync.assert_called_once_with("/pipeline", tmp_path, [])
+
+    def test_folder_size_sums_files_across_pages(self, ingestor):
+        """Sizing follows pagination and ignores folder entries."""
+        file_a = MagicMock(spec=dropbox.files.FileMetadata, size=10)
+        folder = MagicMock(spec=dropbox.files.FolderMetadata)
+        file_b = MagicMock(spec=dropbox.files.FileMetadata, size=5)
+        ingestor.dbx.files_list_folder.return_value = MagicMock(entries=[file_a, folder], has_more=True, cursor="c1")
+        ingestor.dbx.files_list_folder_continue.return_value = MagicMock(entries=[file_b], has_more=False)
+
+        assert ingestor._folder_size("/pipeline") == 15
+        ingestor.dbx.files_list_folder_continue.assert_called_once_with("c1")
+
+    def test_sync_archive_rejects_path_escape(self, ingestor, tmp_path):
+        """Clean Room: entries resolving outside the target folder are refused."""
+        self._list_sizes(ingestor, 4, 2)
+        target = tmp_path / "target"
+        res = self._zip_response({"pipeline/../../escaped.txt": b"x"})
+        ingestor.dbx.files_download_zip.return_value = (None, res)
+
+        with pytest.raises(RuntimeError, match="escapes target"):
+            ingestor.sync_archive("/pipeline", target)
+        assert not (tmp_path / "escaped.txt").exists()
+
+    def test_sync_archive_api_error_handling(self, ingestor, tmp_path):
+        """Rule 4: API failures during archive export propagate to the caller."""
+        self._list_sizes(ingestor, 4, 2)
+        ingestor.dbx.files_download_zip.side_effect = dropbox.exceptions.ApiError(
+            "1", MagicMock(), "Export Failed", None
+        )
+        with pytest.raises(dropbox.exceptions.ApiError):
+            ingestor.sync_archive("/pipeline", tmp_path)
+
     # --- SECTION 3: DOWNLOAD LOGIC (Lines 106-120) ---
 
     def test_download_file_binary_integrity(self, ingestor, tmp_path):
         """Covers Lines 111-116."""
         target = tmp_path / "test.bin"
         mock_res = MagicMock()
-        mock_res.content = b"\x00\xFF\xAA\x55" # Simulation artifact binary data
+        # Simulation artifact binary data, delivered as streamed chunks
+        mock_res.iter_content.return_value = [b"\x00\xFF", b"\xAA\x55"]
         
         ingestor.dbx.files_download.return_value = (None, mock_res)
 
@@ -91,6 +311,9 @@ class TestCloudIngestor:
         ingestor._download_file("/cloud/test.bin", target)
         
         assert target.read_bytes() == b"\x00\xFF\xAA\x55"
+        mock_res.iter_content.assert_called_once_with(chunk_size=CloudIngestor.CHUNK_SIZE)
+        # The HTTP response is released once the stream is drained
+        mock_res.__exit__.assert_called_once()
 
     def test_download_file_failure(self, ingestor, tmp_path):
         """Covers Lines 117-119."""
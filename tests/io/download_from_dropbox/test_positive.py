@@ -29,7 +29,7 @@ class TestCloudIngestor:
         """
         Rule 5 (Nomadic Sustainability): Handles token expiration automatically.
         """
-        with patch('requests.post') as mock_post:
+        with patch("src.io.dropbox_utils._SESSION.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {"access_token": "new_temp_token"}
             
@@ -62,7 +62,7 @@ class TestCloudIngestor:
         mock_dbx.files_list_folder_continue.return_value = page2
 
         # Ingestor uses TokenManager + CloudIngestor
-        with patch("requests.post") as m:
+        with patch("src.io.dropbox_utils._SESSION.post") as m:
             m.return_value.status_code = 200
             m.return_value.json.return_value = {"access_token": "mock"}
             tm = TokenManager("key", "secret")
@@ -80,7 +80,7 @@ class TestCloudIngestor:
         """
         Rule 4: Zero-Default Policy - Engine must crash on invalid credentials.
         """
-        with patch('requests.post') as mock_post:
+        with patch("src.io.dropbox_utils._SESSION.post") as mock_post:
             mock_post.return_value.status_code = 401
             mock_post.return_value.text = "Dropbox Auth Failed"
             
@@ -3,7 +3,7 @@
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
-from src.io.dropbox_utils import TokenManager
+from src.io.dropbox_utils import _SESSION, TokenManager
 
 class TestTokenManager:
     @pytest.fixture
@@ -19,7 +19,7 @@ class TestTokenManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"access_token": "new_secret_token"}
         
-        with patch("requests.post", return_value=mock_response):
+        with patch("src.io.dropbox_utils._SESSION.post", return_value=mock_response):
             token = token_manager.refresh_access_token("refresh_val")
             assert token == "new_secret_token"
 
@@ -31,7 +31,7 @@ class TestTokenManager:
         mock_response.status_code = 401
         mock_response.text = "Invalid Grant"
         
-        with patch("requests.post", return_value=mock_response):
+        with patch("src.io.dropbox_utils._SESSION.post", return_value=mock_response):
             with pytest.raises(RuntimeError, match="Dropbox Auth Failed"):
                 token_manager.refresh_access_token("bad_refresh_val")
 
@@ -43,11 +43,45 @@ class TestTokenManager:
         This forces the code into the critical logger and re-raises the error.
         """
         # We simulate a connection timeout/error from the requests library
-        with patch("requests.post", side_effect=requests.exceptions.RequestException("DNS Timeout")):
+        with patch("src.io.dropbox_utils._SESSION.post", side_effect=requests.exceptions.RequestException("DNS Timeout")):
             with pytest.raises(requests.exceptions.RequestException, match="DNS Timeout"):
                 token_manager.refresh_access_token("any_token")
                 
     def test_slots_compliance(self, token_manager):
         """Rule 0: Verify __slots__ is effectively preventing dynamic dicts."""
         with pytest.raises(AttributeError):
-            token_manager.new_attr = "this should fail"
\ No newline at end of file
+            token_manager.new_attr = "this should fail"
+
+    # --- SECTION 4: TOKEN CACHE ---
+
+    def test_refresh_access_token_cached_until_expiry(self, token_manager):
+        """Rule 0: A still-valid token is reused; no second network round trip."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "cached_token", "expires_in": 14400}
+
+        with patch("src.io.dropbox_utils._SESSION.post", return_value=mock_response) as mock_post:
+            assert token_manager.refresh_access_token("refresh_val") == "cached_token"
+            assert token_manager.refresh_access_token("refresh_val") == "cached_token"
+            mock_post.assert_called_once()
+            assert mock_post.call_args.kwargs["timeout"] == TokenManager.REQUEST_TIMEOUT
+
+    def test_refresh_access_token_expired_cache_refetches(self, token_manager):
+        """Tokens inside the expiry margin are refreshed, not served stale."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "short_lived", "expires_in": TokenManager.EXPIRY_MARGIN}
+
+        with patch("src.io.dropbox_utils._SESSION.post", return_value=mock_response) as mock_post:
+            token_manager.refresh_access_token("refresh_val")
+            token_manager.refresh_access_token("refresh_val")
+            assert mock_post.call_count == 2
+
+    # --- SECTION 5: TRANSPORT RETRIES ---
+
+    def test_session_retries_token_post_on_transient_status(self):
+        """The idempotent token POST is retried on 429/5xx, not only on connect errors."""
+        retry = _SESSION.get_adapter(TokenManager.TOKEN_URL).max_retries
+        assert retry.is_retry("POST", 503)
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 401)
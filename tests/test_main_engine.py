@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import threading
 from unittest.mock import patch
 from datetime import datetime, timezone
 from src.core.constants import OrchestrationStatus
@@ -125,6 +126,134 @@ class TestMainEnginePhysical:
                 mock_trigger.assert_called_once()
                 assert "alpha_solver" in mock_trigger.call_args[0][1]["step"]
 
+    def test_ready_steps_dispatched_concurrently(self, nomadic_node):
+        """Rule 0: Independent signals are in flight together; each is ledgered once."""
+        config_dir, data_dir, _ = nomadic_node
+        (config_dir / "active_disk.json").write_text(json.dumps({
+            "project_id": "PROJ-FAN", "manifest_url": "..."
+        }))
+        (data_dir / "input.csv").write_text("artifact data")
+
+        def step(name):
+            return {
+                "name": name,
+                "requires": ["input.csv"],
+                "produces": [f"{name}.csv"],
+                "timeout_hours": 6,
+                "target_repo": f"nomad/{name}"
+            }
+
+        with patch("src.core.bootloader.Bootloader.hydrate") as mock_hydrate:
+            def hydrate_fan_out(state_obj):
+                state_obj.hydrate_manifest({
+                    "manifest_id": "M-FAN",
+                    "project_id": "PROJ-FAN",
+                    "pipeline_steps": [step("alpha"), step("beta")]
+                })
+                waiting = {"status": OrchestrationStatus.WAITING.value}
+                return {"steps": {"alpha": dict(waiting), "beta": dict(waiting)}}
+
+            mock_hydrate.side_effect = hydrate_fan_out
+            # Both workers must reach the barrier together, or it breaks on timeout
+            in_flight = threading.Barrier(2, timeout=5)
+
+            def signal(target_repo, payload):
+                in_flight.wait()
+                return True
+
+            with patch("src.api.github_trigger.Dispatcher.trigger_worker", side_effect=signal), \
+                 patch("src.core.update_ledger.LedgerManager.log_dispatch") as mock_log:
+                run_engine()
+
+        assert sorted(c.kwargs["step_name"] for c in mock_log.call_args_list) == ["alpha", "beta"]
+
+    def test_steps_sharing_a_repo_dispatched_sequentially(self, nomadic_node):
+        """Traceability: one repo never has two signals awaiting its runs lookup at once."""
+        config_dir, data_dir, _ = nomadic_node
+        (config_dir / "active_disk.json").write_text(json.dumps({
+            "project_id": "PROJ-SHARED", "manifest_url": "..."
+        }))
+        (data_dir / "input.csv").write_text("artifact data")
+
+        def step(name):
+            return {
+                "name": name,
+                "requires": ["input.csv"],
+                "produces": [f"{name}.csv"],
+                "timeout_hours": 6,
+                "target_repo": "nomad/shared"
+            }
+
+        with patch("src.core.bootloader.Bootloader.hydrate") as mock_hydrate:
+            def hydrate_shared(state_obj):
+                state_obj.hydrate_manifest({
+                    "manifest_id": "M-SHARED",
+                    "project_id": "PROJ-SHARED",
+                    "pipeline_steps": [step("alpha"), step("beta")]
+                })
+                waiting = {"status": OrchestrationStatus.WAITING.value}
+                return {"steps": {"alpha": dict(waiting), "beta": dict(waiting)}}
+
+            mock_hydrate.side_effect = hydrate_shared
+            beta_started = threading.Event()
+            order = []
+
+            def signal(target_repo, payload):
+                order.append(payload["step"])
+                if payload["step"] == "beta":
+                    beta_started.set()
+                else:
+                    # Had beta been fired alongside alpha, it would start inside this window
+                    assert not beta_started.wait(timeout=0.2)
+                return True
+
+            with patch("src.api.github_trigger.Dispatcher.trigger_worker", side_effect=signal), \
+                 patch("src.core.update_ledger.LedgerManager.log_dispatch") as mock_log:
+                run_engine()
+
+        assert order == ["alpha", "beta"]
+        assert [c.kwargs["step_name"] for c in mock_log.call_args_list] == ["alpha", "beta"]
+
+    def test_raising_signal_does_not_drop_accepted_ledger_entries(self, nomadic_node):
+        """Rule 4: A signal that raises is reported failed; accepted siblings are still ledgered."""
+        config_dir, data_dir, _ = nomadic_node
+        (config_dir / "active_disk.json").write_text(json.dumps({
+            "project_id": "PROJ-MIX", "manifest_url": "..."
+        }))
+        (data_dir / "input.csv").write_text("artifact data")
+
+        def step(name):
+            return {
+                "name": name,
+                "requires": ["input.csv"],
+                "produces": [f"{name}.csv"],
+                "timeout_hours": 6,
+                "target_repo": f"nomad/{name}"
+            }
+
+        with patch("src.core.bootloader.Bootloader.hydrate") as mock_hydrate:
+            def hydrate_mixed(state_obj):
+                state_obj.hydrate_manifest({
+                    "manifest_id": "M-MIX",
+                    "project_id": "PROJ-MIX",
+                    "pipeline_steps": [step("alpha"), step("beta")]
+                })
+                waiting = {"status": OrchestrationStatus.WAITING.value}
+                return {"steps": {"alpha": dict(waiting), "beta": dict(waiting)}}
+
+            mock_hydrate.side_effect = hydrate_mixed
+
+            def signal(target_repo, payload):
+                if payload["step"] == "alpha":
+                    raise ValueError("Malformed runs response")
+                return True
+
+            with patch("src.api.github_trigger.Dispatcher.trigger_worker", side_effect=signal), \
+                 patch("src.core.update_ledger.LedgerManager.log_dispatch") as mock_log:
+                run_engine()
+
+        assert [c.kwargs["step_name"] for c in mock_log.call_args_list] == ["beta"]
+
     def test_stale_ledger_overwritten_by_physical_sync(self, nomadic_node):
         """Rule 4: Memory-Disk Sync. Verify that Bootloader overrides a stale physical ledger."""
         config_dir, _, _ = nomadic_node